@@ -1,6 +1,7 @@
-from app import app, socketio
+from app import app
 
 app.debug = False
 
 if __name__ == '__main__':
-    socketio.run(app)
+    from main import serve
+    serve()
@@ -1,11 +1,58 @@
+import io
 import os
-from flask import Flask, render_template, request
+import time
+import base64
+import asyncio
+import hmac
+import hashlib
+import tempfile
+import threading
+import orjson
+from flask import Flask, Response, render_template, request, jsonify
 from flask_socketio import SocketIO, emit
 from flask_cors import CORS
-from utils.translator import translate_text, transcribe_audio, validate_medical_terms
+try:
+    import uvloop
+except ImportError:  # uvloop does not support Windows
+    uvloop = None
+from utils.translator import (translate_text, transcribe_audio, validation_cache_info,
+                              flush_translation_cache)
+
+def load_or_create_secret(path):
+    """
+    Reuse a persisted secret key so sessions survive reloads and are shared
+    across preloaded workers; fall back to an ephemeral key if the path is unwritable
+    """
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        secret = os.urandom(24)
+        try:
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+            # Write the key in full before it becomes visible under `path`, so a
+            # worker losing the race never reads a half-written (empty) file
+            fd, tmp_path = tempfile.mkstemp(dir=directory)
+            try:
+                with open(fd, 'wb') as f:
+                    f.write(secret)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.link(tmp_path, path)
+            finally:
+                os.unlink(tmp_path)
+        except FileExistsError:
+            # Another worker won the race; use its key
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            pass
+        return secret
 
 app = Flask(__name__)
-app.config['SECRET_KEY'] = os.urandom(24)
+app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY') or load_or_create_secret(
+    os.environ.get('SECRET_KEY_FILE', os.path.join(app.instance_path, 'secret.bin')))
 
 # Configure CORS for both REST and WebSocket
 CORS(app, resources={
@@ -16,75 +63,243 @@ CORS(app, resources={
     }
 })
 
+class OrjsonSerializer:
+    """Drop-in json module for python-socketio backed by orjson"""
+    @staticmethod
+    def dumps(obj, **kwargs):
+        # orjson output is always compact, so the separators argument is implied
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
 # Initialize SocketIO with CORS support
 socketio = SocketIO(app, 
-                   async_mode='eventlet', 
+                   async_mode='threading', 
                    cors_allowed_origins="*",
                    ping_timeout=60,
-                   ping_interval=25)
+                   ping_interval=25,
+                   http_compression=True,
+                   compression_threshold=1024,
+                   json=OrjsonSerializer)
+
+# Rendered once per process; the page shell has no per-request state
+_index_page = {}
+
+def rendered_index():
+    if 'body' not in _index_page:
+        body = render_template('index.html').encode('utf-8')
+        _index_page['etag'] = hashlib.blake2b(body, digest_size=16).hexdigest()
+        _index_page['body'] = body
+    return _index_page['body'], _index_page['etag']
 
 @app.route('/')
 def index():
-    return render_template('index.html')
+    if app.debug:
+        return render_template('index.html')
+    body, etag = rendered_index()
+    response = Response(body, mimetype='text/html')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = 300
+    return response.make_conditional(request)
 
-@socketio.on('transcribe_audio')
-async def handle_transcription(data):
+@app.route('/cache/flush', methods=['POST'])
+def flush_cache():
+    admin_token = os.environ.get('ADMIN_TOKEN')
+    supplied = request.headers.get('X-Admin-Token', '')
+    if not admin_token or not hmac.compare_digest(supplied.encode(), admin_token.encode()):
+        return jsonify({'error': 'forbidden'}), 403
+    return jsonify({'flushed': flush_translation_cache()})
+
+def validation_packet(*validations):
+    """Corrections and warnings from one or more validation results, merged"""
+    corrections = [item for validated in validations for item in validated.get('corrections', [])]
+    warnings = [item for validated in validations for item in validated.get('warnings', [])]
+    if corrections or warnings:
+        return {'corrections': corrections, 'warnings': warnings}
+    return None
+
+# Last validation items sent to each client, so responses only carry changes
+VALIDATION_FULL_SYNC_INTERVAL = 30  # seconds
+validation_state = {}
+validation_lock = threading.Lock()
+
+def validation_delta(sid, packet):
+    """
+    Medical validation details carried inside transcription_response,
+    translation_response and translation_error under the 'validation' key.
+
+    Schema v2: {'v': 2, 'full': bool, 'added': [{'id', 'kind', 'item'}], 'removed': [id]}
+    where kind is 'corrections' or 'warnings'. A full sync (client clears its
+    state first) is sent on the first response and every 30 seconds;
+    None means nothing changed.
+    """
+    current = {}
+    for kind in ('corrections', 'warnings'):
+        for item in (packet or {}).get(kind, []):
+            item_id = f"{kind}:{orjson.dumps(item, option=orjson.OPT_SORT_KEYS).decode()}"
+            current[item_id] = {'id': item_id, 'kind': kind, 'item': item}
+
+    now = time.monotonic()
+    with validation_lock:
+        state = validation_state.get(sid)
+        if state is None or now - state['synced_at'] > VALIDATION_FULL_SYNC_INTERVAL:
+            validation_state[sid] = {'ids': set(current), 'synced_at': now}
+            return {'v': 2, 'full': True, 'added': list(current.values()), 'removed': []}
+        added = [entry for item_id, entry in current.items() if item_id not in state['ids']]
+        removed = [item_id for item_id in state['ids'] if item_id not in current]
+        state['ids'] = set(current)
+
+    if not added and not removed:
+        return None
+    return {'v': 2, 'full': False, 'added': added, 'removed': removed}
+
+def start_event_loop():
+    """
+    Run one asyncio loop (uvloop when available) on a daemon thread; SocketIO
+    handlers stay synchronous and hand their coroutines to it
+    """
+    loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name='asyncio-loop', daemon=True).start()
+    return loop
+
+# Started on first use in each process: threads don't survive fork, so a
+# loop started in a preloading master would be dead in every worker
+_event_loop = None
+_event_loop_lock = threading.Lock()
+
+def get_event_loop():
+    global _event_loop
+    with _event_loop_lock:
+        if _event_loop is None:
+            _event_loop = start_event_loop()
+        return _event_loop
+
+def _forget_event_loop():
+    global _event_loop, _event_loop_lock
+    _event_loop = None
+    _event_loop_lock = threading.Lock()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_forget_event_loop)
+
+# Upper bound for one handler's work on the loop (Whisper upload plus validation retries)
+RUN_ASYNC_TIMEOUT = 120  # seconds
+
+def run_async(coro):
+    """Run a coroutine on the shared event loop and wait for its result"""
+    future = asyncio.run_coroutine_threadsafe(coro, get_event_loop())
     try:
-        audio_data = data['audio']
-        language = data['language']
-        
-        # Transcribe audio using Whisper
-        transcription = await transcribe_audio(audio_data, language)
-        
-        if 'error' in transcription:
-            emit('transcription_error', {
-                'error': transcription['error'],
-                'message': transcription['message']
-            })
-            return
+        return future.result(timeout=RUN_ASYNC_TIMEOUT)
+    except TimeoutError:
+        future.cancel()
+        raise
 
-        if transcription and transcription['text']:
-            # Validate medical terminology
-            validated = validate_medical_terms(transcription['text'])
-            
-            if 'error' in validated:
-                emit('transcription_response', {
-                    'success': True,
-                    'text': transcription['text'],  # Use original text if validation fails
-                    'detected_language': transcription['detected_language'],
-                    'confidence': transcription['confidence'],
-                    'validation_error': validated['message']
-                })
-            else:
-                response_data = {
-                    'success': True,
-                    'text': validated.get('corrected_text', validated.get('text', transcription['text'])),
-                    'detected_language': transcription['detected_language'],
-                    'confidence': transcription['confidence'],
-                    'medical_terms': validated.get('medical_terms_found', []),
-                    'corrections': validated.get('corrections', []),
-                    'warnings': validated.get('warnings', [])
-                }
-                
-                # If there are corrections or warnings, send them to the client
-                if validated.get('corrections') or validated.get('warnings'):
-                    emit('medical_validation_info', {
-                        'corrections': validated.get('corrections', []),
-                        'warnings': validated.get('warnings', [])
-                    })
-                
-                emit('transcription_response', response_data)
+def decode_audio_payload(audio_data):
+    """
+    Turn a raw binary attachment or a base64 (optionally data-URL) string into
+    a named in-memory file for the Whisper client
+    """
+    extension = 'webm'
+    if isinstance(audio_data, (bytes, bytearray)):
+        # BytesIO shares the buffer of an immutable bytes object until written to
+        audio_file = io.BytesIO(bytes(audio_data))
+    else:
+        header, sep, payload = audio_data.partition(',')
+        if sep:
+            mime = header.partition(':')[2].partition(';')[0]
+            extension = mime.rpartition('/')[2] or extension
         else:
-            emit('transcription_error', {
-                'error': 'transcription_failed',
-                'message': 'Failed to transcribe audio'
-            })
+            payload = header
+        audio_file = io.BytesIO(base64.b64decode(payload))
+    # Whisper infers the container format from the file name
+    audio_file.name = f"audio.{extension}"
+    return audio_file
+
+# Per-client backpressure: one transcription in flight per sid, and only the
+# newest frame that arrived meanwhile is kept (intermediate frames are dropped)
+transcriptions_in_flight = set()
+pending_frames = {}
+frames_lock = threading.Lock()
+
+@socketio.on('transcribe_audio')
+def handle_transcription(data):
+    sid = request.sid
+    with frames_lock:
+        if sid in transcriptions_in_flight:
+            pending_frames[sid] = data
+            return
+        transcriptions_in_flight.add(sid)
+
+    try:
+        while data is not None:
+            transcribe_frame(data)
+            with frames_lock:
+                data = pending_frames.pop(sid, None)
+                if data is None:
+                    transcriptions_in_flight.discard(sid)
+    except BaseException:
+        with frames_lock:
+            transcriptions_in_flight.discard(sid)
+            pending_frames.pop(sid, None)
+        raise
+
+def transcribe_frame(data):
+    try:
+        audio_file = decode_audio_payload(data['audio'])
+        event, payload = run_async(process_transcription(audio_file, data['language']))
+        if 'validation' in payload:
+            payload['validation'] = validation_delta(request.sid, payload['validation'])
+        emit(event, payload)
     except Exception as e:
         emit('transcription_error', {
             'error': 'system_error',
             'message': str(e)
         })
 
+async def process_transcription(audio_file, language):
+    """
+    Transcribe and validate on the shared event loop; returns the (event, payload)
+    to emit, since the loop thread has no SocketIO request context
+    """
+    # Transcribe audio using Whisper
+    transcription = await transcribe_audio(audio_file, language)
+    
+    if 'error' in transcription:
+        return 'transcription_error', {
+            'error': transcription['error'],
+            'message': transcription['message']
+        }
+
+    if not (transcription and transcription['text']):
+        return 'transcription_error', {
+            'error': 'transcription_failed',
+            'message': 'Failed to transcribe audio'
+        }
+
+    # transcribe_audio already validated and corrected the text; reuse its result
+    validated = transcription.get('medical_validation') or {}
+    
+    if 'error' in validated:
+        return 'transcription_response', {
+            'success': True,
+            'text': transcription['text'],  # Use original text if validation fails
+            'detected_language': transcription['detected_language'],
+            'confidence': transcription['confidence'],
+            'validation_error': validated['message']
+        }
+
+    return 'transcription_response', {
+        'success': True,
+        'text': transcription['text'],
+        'detected_language': transcription['detected_language'],
+        'confidence': transcription['confidence'],
+        'medical_terms': validated.get('medical_terms_found', []),
+        'validation': validation_packet(validated)
+    }
+
 @socketio.on('translate_message')
 def handle_translation(data):
     try:
@@ -92,43 +307,37 @@ def handle_translation(data):
         source_lang = data['source_lang']
         target_lang = data['target_lang']
         
-        # Validate medical terminology before translation
-        validated = validate_medical_terms(text)
-        
-        # Use validated text if available, otherwise use original
-        text_to_translate = validated.get('corrected_text', validated.get('text', text))
-        
-        # If there are medical term corrections, notify the client
-        if validated.get('corrections') or validated.get('warnings'):
-            emit('medical_validation_info', {
-                'corrections': validated.get('corrections', []),
-                'warnings': validated.get('warnings', [])
-            })
-        
-        # Translate the validated text
-        translation = translate_text(text_to_translate, source_lang, target_lang)
+        # translate_text validates and corrects the text before translating;
+        # reuse the validation it returns rather than running another
+        translation = run_async(translate_text(text, source_lang, target_lang))
+        validated = translation.get('medical_validation') or {}
         
         if 'error' in translation:
             emit('translation_error', {
                 'error': translation['error'],
-                'message': translation['message']
+                'message': translation['message'],
+                'validation': validation_delta(request.sid, validation_packet(validated))
             })
             return
         
+        # Corrections and warnings from both sides travel only in the delta;
+        # the full validation dicts are never sent
+        translated_validated = translation.get('translated_validation') or {}
+        medical_terms = (validated.get('medical_terms_found')
+                         or translated_validated.get('medical_terms_found') or [])
+        
         # Emit the translation back to the client
         response_data = {
             'original': text,
             'translated': translation['text'],
             'source_lang': translation['source_lang'],
             'target_lang': translation['target_lang'],
-            'confidence': translation['confidence']
+            'confidence': translation['confidence'],
+            'cache_hit': translation.get('cache_hit', False),
+            'validation': validation_delta(request.sid, validation_packet(validated, translated_validated))
         }
-        
-        # Include medical validation information if available
-        if translation.get('medical_validation'):
-            response_data['medical_validation'] = translation['medical_validation']
-        if translation.get('translated_validation'):
-            response_data['translated_validation'] = translation['translated_validation']
+        if medical_terms:
+            response_data['medical_terms'] = medical_terms
         
         emit('translation_response', response_data)
         
@@ -140,8 +349,13 @@ def handle_translation(data):
 
 @socketio.on('connect')
 def handle_connect():
+    app.logger.info(f"Medical validation cache: {validation_cache_info()}")
     emit('connection_response', {'data': 'Connected'})
 
 @socketio.on('disconnect')
 def handle_disconnect():
+    with frames_lock:
+        pending_frames.pop(request.sid, None)
+    with validation_lock:
+        validation_state.pop(request.sid, None)
     print('Client disconnected')
@@ -0,0 +1,9 @@
+import os
+
+# SocketIO keeps per-client state in memory, so a single worker process;
+# websocket connections each hold a thread, hence a large thread pool.
+# Gunicorn sets TCP_NODELAY on its listener, so small frames are not delayed.
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+workers = 1
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 100))
@@ -1,9 +1,13 @@
 import os
-from app import app, socketio
+import sys
+from app import app
+
+def serve():
+    """Run the production server: gunicorn with the settings in gunicorn.conf.py"""
+    from gunicorn.app.wsgiapp import run
+    config = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gunicorn.conf.py')
+    sys.argv = [sys.argv[0], '--config', config, 'main:app']
+    run()
 
 if __name__ == '__main__':
-    port = int(os.environ.get("PORT", 5000))
-    socketio.run(app, 
-                host='0.0.0.0', 
-                port=port,
-                allow_unsafe_werkzeug=True)
+    serve()
@@ -20,6 +20,24 @@ document.addEventListener('DOMContentLoaded', () => {
     // Message timeout tracking
     let messageTimeout = null;
 
+    // Medical validation items currently shown, keyed by server-assigned id
+    const validationItems = new Map();
+
+    // Apply a v2 validation delta (null means unchanged) and return the
+    // current corrections/warnings, or null when there are none
+    function applyValidationDelta(delta) {
+        if (delta) {
+            if (delta.full) validationItems.clear();
+            (delta.removed || []).forEach(id => validationItems.delete(id));
+            (delta.added || []).forEach(entry => validationItems.set(entry.id, entry));
+        }
+        if (validationItems.size === 0) return null;
+
+        const current = { corrections: [], warnings: [] };
+        validationItems.forEach(entry => current[entry.kind].push(entry.item));
+        return current;
+    }
+
     // Socket Events
     socket.on('connect', () => {
         showStatus('Connected to server', 'success');
@@ -30,17 +48,18 @@ document.addEventListener('DOMContentLoaded', () => {
         showStatus('Translation complete', 'success');
         
         // Display medical validation info if available
-        if (data.medical_validation || data.translated_validation) {
-            displayMedicalInfo(data.medical_validation || data.translated_validation);
+        const validation = applyValidationDelta(data.validation);
+        if (validation || data.medical_terms) {
+            displayMedicalInfo({ ...validation, medical_terms_found: data.medical_terms });
         }
     });
 
     socket.on('translation_error', (data) => {
         showStatus(data.error, 'danger', true);
-    });
-
-    socket.on('medical_validation_info', (data) => {
-        displayMedicalInfo(data);
+        const validation = applyValidationDelta(data.validation);
+        if (validation) {
+            displayMedicalInfo(validation);
+        }
     });
 
     // Speech Events
@@ -156,7 +175,9 @@ document.addEventListener('DOMContentLoaded', () => {
                         break;
                 }
                 
-                const termText = term.term || JSON.stringify(term);
+                const termText = term.expansion ?
+                    `${term.term} = ${term.expansion}` :
+                    term.term || JSON.stringify(term);
                 content += `<li class="${colorClass}"><i class="fas fa-${icon}"></i> ${termText} (${termType})</li>`;
             });
             content += '</ul>';
@@ -0,0 +1,40 @@
+import os
+import unittest
+from unittest import mock
+
+os.environ.setdefault('OPENAI_API_KEY', 'test')
+
+from utils import translator
+from utils.translator import protect_medical_terms, restore_medical_terms
+
+
+class ProtectMedicalTermsTest(unittest.TestCase):
+    def test_ordinary_sentences_are_left_alone(self):
+        for text in ["I have 2 grandkids", "at 3 gates", "im tired", "un po di acqua"]:
+            with self.subTest(text=text):
+                self.assertEqual(protect_medical_terms(text), (text, []))
+
+    def test_medical_terms_are_preserved(self):
+        text = "Give 500 mg PO BID, BP 120, 38°C"
+        protected, terms = protect_medical_terms(text)
+        self.assertEqual(terms, ['500 mg', 'PO', 'BID', 'BP 120', '38°C'])
+        self.assertNotIn('500 mg', protected)
+        self.assertEqual(restore_medical_terms(protected, terms), text)
+
+
+
+class TranslateTextCacheTest(unittest.IsolatedAsyncioTestCase):
+    async def test_fallback_validation_is_not_cached(self):
+        fallback = {'text': 'take aspirin', 'validated': True, 'fallback': 'cached_validations'}
+        translation = {'text': 'tomar aspirina', 'src': 'en', 'dest': 'es'}
+        with mock.patch.object(translator, 'validate_medical_terms_cached', mock.AsyncMock(return_value=fallback)), \
+                mock.patch.object(translator, 'google_translate', mock.AsyncMock(return_value=translation)) as google:
+            first = await translator.translate_text('take aspirin', 'en', 'es')
+            second = await translator.translate_text('take aspirin', 'en', 'es')
+        self.assertNotIn('cache_hit', first)
+        self.assertNotIn('cache_hit', second)
+        self.assertEqual(google.await_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,63 +1,255 @@
 import os
 import time
-import functools
+import hashlib
+import threading
 import asyncio
 import json
 import re
 import logging
-from typing import List, Dict, Any, Optional
-from concurrent.futures import ThreadPoolExecutor
+import queue
+import unicodedata
+import stat
+import atexit
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Dict, Any, Optional, Tuple
 from functools import lru_cache
-from collections import deque
-from datetime import datetime, timedelta
-from googletrans import Translator
-from openai import OpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from datetime import datetime
+import httpx
+import orjson
+from cachetools import LRUCache, TTLCache
+from diskcache import Cache
+from openai import AsyncOpenAI, RateLimitError, APIConnectionError, APITimeoutError, InternalServerError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+
+# Patterns compiled on the fly (re.sub/re.match with string patterns) are kept
+# in re's module cache; a larger cache keeps them from being evicted by other modules
+re._MAXCACHE = max(re._MAXCACHE, 2048)
+
+# Configure logging; records go through a queue to a listener thread so
+# handlers never block on stream or file I/O
+log_queue = queue.SimpleQueue()
+log_queue_handler = QueueHandler(log_queue)
+log_listener = QueueListener(log_queue, logging.StreamHandler(), respect_handler_level=True)
+logging.basicConfig(level=logging.INFO, handlers=[log_queue_handler])
+log_listener.start()
+atexit.register(lambda: log_listener.stop())
 logger = logging.getLogger(__name__)
 
-# Initialize OpenAI client with API key
-client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+def _restart_log_listener():
+    """The listener thread doesn't survive fork; give a forked worker its own queue and listener"""
+    global log_queue, log_listener
+    log_queue = queue.SimpleQueue()
+    log_queue_handler.queue = log_queue
+    log_listener = QueueListener(log_queue, *log_listener.handlers, respect_handler_level=True)
+    log_listener.start()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_log_listener)
+
+# Every request is bounded so a hung connection fails fast into the retry
+# and circuit breaker logic
+OPENAI_TIMEOUT = 10.0  # seconds, chat completions
+WHISPER_TIMEOUT = 30.0  # seconds, transcriptions upload the whole recording
+
+def create_openai_client(max_connections: int) -> AsyncOpenAI:
+    """
+    OpenAI client over its own keep-alive HTTP/2 connection pool; like every
+    async client here it belongs to the app's single event loop
+    """
+    http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=max_connections // 2, max_connections=max_connections)
+    )
+    # retry_api_call owns retries; SDK retries underneath would multiply attempts
+    return AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY'), http_client=http_client,
+                       timeout=OPENAI_TIMEOUT, max_retries=0)
+
+# Bulkhead per call type: slow Whisper uploads can exhaust only their own
+# connection pool, never the one GPT-4 validation depends on, and vice versa
+transcription_client = create_openai_client(max_connections=25)
+validation_client = create_openai_client(max_connections=25)
+
+# Bulkhead for GPT-4 calls: at most OPENAI_CONCURRENCY requests in flight,
+# so large term batches don't trigger 429s
+OPENAI_CONCURRENCY = int(os.getenv('OPENAI_CONCURRENCY', '8'))
+openai_semaphore = asyncio.Semaphore(OPENAI_CONCURRENCY)
 
 # Circuit breaker configuration
 class CircuitBreaker:
-    def __init__(self, failure_threshold=5, reset_timeout=60):
+    """
+    Shared by the event loop and worker threads, so all state changes happen
+    under a lock. Half-open admits a single probe; each failed probe doubles
+    the time the breaker stays open, up to max_reset_timeout.
+    """
+    def __init__(self, failure_threshold=5, reset_timeout=60, max_reset_timeout=300):
         self.failure_count = 0
         self.failure_threshold = failure_threshold
+        self.base_reset_timeout = reset_timeout
         self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
         self.last_failure_time = None
         self.state = "closed"  # closed, open, half-open
+        self._consecutive_opens = 0
+        self._probe_started = None
+        self._lock = threading.Lock()
+
+    def _open(self):
+        self.state = "open"
+        self._probe_started = None
+        self.reset_timeout = min(self.base_reset_timeout * 2 ** self._consecutive_opens, self.max_reset_timeout)
+        self._consecutive_opens += 1
+        logger.warning(f"Circuit breaker opened for {self.reset_timeout}s after {self.failure_count} failures")
 
     def record_failure(self):
-        self.failure_count += 1
-        self.last_failure_time = time.time()
-        if self.failure_count >= self.failure_threshold:
-            self.state = "open"
-            logger.warning(f"Circuit breaker opened due to {self.failure_count} failures")
+        with self._lock:
+            self.failure_count += 1
+            self.last_failure_time = time.monotonic()
+            if self.state == "half-open" or (self.state == "closed" and self.failure_count >= self.failure_threshold):
+                self._open()
 
     def record_success(self):
-        self.failure_count = 0
-        self.state = "closed"
+        with self._lock:
+            self.failure_count = 0
+            self.state = "closed"
+            self.reset_timeout = self.base_reset_timeout
+            self._consecutive_opens = 0
+            self._probe_started = None
+
+    def is_open(self):
+        """Whether calls are currently refused outright; unlike can_execute, never claims the probe"""
+        with self._lock:
+            return self.state == "open" and time.monotonic() - self.last_failure_time <= self.reset_timeout
 
     def can_execute(self):
-        if self.state == "closed":
-            return True
-        if self.state == "open":
-            if time.time() - self.last_failure_time > self.reset_timeout:
-                self.state = "half-open"
+        with self._lock:
+            if self.state == "closed":
                 return True
-            return False
-        return self.state == "half-open"
+            now = time.monotonic()
+            if self.state == "open":
+                if now - self.last_failure_time <= self.reset_timeout:
+                    return False
+                self.state = "half-open"
+            # Half-open: one probe at a time; a probe that never reported back
+            # is given up on after reset_timeout
+            if self._probe_started is not None and now - self._probe_started <= self.reset_timeout:
+                return False
+            self._probe_started = now
+            return True
 
 # Initialize circuit breakers
 api_circuit_breaker = CircuitBreaker()
 translation_circuit_breaker = CircuitBreaker()
 
-# Response cache for translations and validations
+# Google Translate endpoint, called over a shared keep-alive HTTP/2 pool so
+# translations are awaited on the event loop instead of blocking a thread
+GOOGLE_TRANSLATE_URL = "https://translate.googleapis.com/translate_a/single"
+translate_http_client = httpx.AsyncClient(
+    http2=True,
+    timeout=httpx.Timeout(connect=2.0, read=8.0, write=2.0, pool=1.0),
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+)
+
+async def google_translate(text: str, source_lang: str, target_lang: str) -> Dict[str, Any]:
+    """Translate one text; returns its translated text and detected source language"""
+    if not translation_circuit_breaker.can_execute():
+        raise RuntimeError("Translation circuit breaker is open")
+    try:
+        response = await translate_http_client.post(
+            GOOGLE_TRANSLATE_URL,
+            params={'client': 'gtx', 'sl': source_lang, 'tl': target_lang, 'dt': 't'},
+            data={'q': text}
+        )
+        response.raise_for_status()
+    except httpx.PoolTimeout:
+        # Our own connection pool is saturated; the endpoint itself is fine
+        raise
+    except httpx.TransportError:
+        # Timeouts and connection failures count against the endpoint
+        translation_circuit_breaker.record_failure()
+        raise
+    except httpx.HTTPStatusError as e:
+        # Rate limiting and server errors do too; other 4xx are our request's fault
+        if e.response.status_code == 429 or e.response.status_code >= 500:
+            translation_circuit_breaker.record_failure()
+        raise
+    translation_circuit_breaker.record_success()
+    data = response.json()
+    return {
+        'text': ''.join(segment[0] for segment in data[0] or [] if segment and segment[0]),
+        'src': data[2] if len(data) > 2 and data[2] else source_lang,
+        'dest': target_lang
+    }
+
+# Response cache for translations and validations; bounded, evicting the
+# least recently used entry when full and anything past its stale window
 CACHE_TIMEOUT = 3600  # 1 hour
-response_cache = {}
+CACHE_MAX_ENTRIES = 10_000
+# Stale-while-revalidate: past CACHE_TIMEOUT an entry of these kinds is still
+# served for this long while it is refreshed in the background
+STALE_WINDOWS = {
+    'term': 24 * 3600,  # medical term validations rarely change
+    'translation': 3600
+}
+# Striped into shards with their own lock so concurrent lookups rarely contend
+CACHE_SHARDS = 16
+response_cache = [
+    (TTLCache(maxsize=CACHE_MAX_ENTRIES // CACHE_SHARDS, ttl=CACHE_TIMEOUT + max(STALE_WINDOWS.values()),
+              timer=time.monotonic),
+     threading.Lock())
+    for _ in range(CACHE_SHARDS)
+]
+CacheKey = Tuple[str, ...]
+
+def private_cache_dir(path: str) -> str:
+    """
+    Create a cache directory readable only by the current user; refuse a
+    symlink or a directory someone else owns instead of writing through it
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    info = os.lstat(path)
+    if stat.S_ISLNK(info.st_mode) or (hasattr(os, 'geteuid') and info.st_uid != os.geteuid()):
+        raise RuntimeError(f"Cache directory {path} must be a directory owned by the current user")
+    if stat.S_IMODE(info.st_mode) != 0o700:
+        os.chmod(path, 0o700)
+    return path
+
+# Per-user cache root rather than the shared temp directory, where another
+# account could claim the path first
+CACHE_ROOT = os.path.join(os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'naomed')
+
+# Whisper transcripts keyed by audio hash, so a re-sent recording isn't
+# transcribed twice. Only the raw transcript is kept, briefly, and in an
+# owner-only directory since it is patient speech
+WHISPER_CACHE_DIR = os.getenv('WHISPER_CACHE_DIR', os.path.join(CACHE_ROOT, 'whisper'))
+WHISPER_CACHE_EXPIRE = 3600  # 1 hour
+whisper_cache = Cache(private_cache_dir(WHISPER_CACHE_DIR), size_limit=2 << 30,
+                      eviction_policy='least-recently-used')
+
+# Persistent GPT-4 term validations, so restarts and other workers start warm;
+# the in-memory response cache stays in front of it
+TERM_CACHE_DIR = os.getenv('TERM_CACHE_DIR', os.path.join(CACHE_ROOT, 'terms'))
+TERM_CACHE_EXPIRE = 24 * 3600  # 24 hours
+term_cache = Cache(private_cache_dir(TERM_CACHE_DIR), size_limit=256 << 20, eviction_policy='least-recently-used')
+
+# diskcache only drops expired rows while writing, so a quiet server would
+# keep transcripts past their hour; purge on a timer as well
+CACHE_PURGE_INTERVAL = 60  # seconds
+
+def purge_expired_caches():
+    while True:
+        try:
+            whisper_cache.expire()
+            term_cache.expire()
+        except Exception as e:
+            logger.error(f"Cache purge failed: {str(e)}")
+        time.sleep(CACHE_PURGE_INTERVAL)
+
+def start_cache_purger():
+    threading.Thread(target=purge_expired_caches, name='cache-purger', daemon=True).start()
+
+start_cache_purger()
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=start_cache_purger)
 
 # Extended Language code mapping
 LANGUAGE_CODES = {
@@ -78,13 +270,73 @@ LANGUAGE_CODES = {
     'tr': ['tr-TR', 'tr']   # Turkish
 }
 
+# Lower-cased code or variant -> normalized code, built once for O(1) lookups
+LANGUAGE_LOOKUP = {
+    variant.lower(): code
+    for code, variants in LANGUAGE_CODES.items()
+    for variant in (code, *variants)
+}
+
 # Common medical term patterns
 MEDICAL_PATTERNS = {
-    'measurements': r'\d+\s*(mg|mcg|ml|g|kg|mmHg|°[CF])',
-    'vital_signs': r'(BP|HR|RR|SpO2|Temp)[:\s]*\d+',
-    'common_abbreviations': r'\b(IV|IM|SC|PO|PRN|bid|tid|qid|qd|hs)\b',
+    name: re.compile(pattern, re.IGNORECASE)
+    for name, pattern in {
+        'measurements': r'\d+\s*(?:mg|mcg|ml|g|kg|mmHg|°[CF])',
+        'vital_signs': r'(?:BP|HR|RR|SpO2|Temp)[:\s]*\d+',
+        'common_abbreviations': r'\b(?:IV|IM|SC|PO|PRN|bid|tid|qid|qd|hs)\b',
+    }.items()
 }
 
+# All medical patterns fused into one alternation so text is scanned once;
+# match.lastgroup names the pattern that matched
+MEDICAL_TERMS_RE = re.compile(
+    "|".join(f"(?P<{name}>{pattern.pattern})" for name, pattern in MEDICAL_PATTERNS.items()),
+    re.IGNORECASE
+)
+
+# Validation entry for each pattern type, precomputed since a pattern match
+# always gets the same verdict; shared between results and never mutated
+PATTERN_VALIDATIONS = {
+    name: {'confidence': 1.0, 'type': name, 'source': 'pattern'}
+    for name in MEDICAL_PATTERNS
+}
+
+# Fixed GPT-4 system messages, built once rather than per request
+VALIDATION_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a medical terminology expert. Validate and correct medical terms while preserving the original meaning. Return your response in a valid JSON format."
+}
+TERM_VALIDATION_SYSTEM_MESSAGE = {"role": "system", "content": "Validate this medical term and return JSON"}
+
+# Whisper context prompt. Whisper treats the prompt as preceding transcript and
+# keeps only its last 224 tokens, so a short glossary in the target style
+# biases spelling as well as long instructions did
+WHISPER_MEDICAL_PROMPT = (
+    "Medical consultation covering diagnoses, medications, allergies and dosages: "
+    "500 mg, 25 mcg, 10 mL, °C/°F. Vitals: BP 120/80 mmHg, HR, RR, SpO2. "
+    "Abbreviations: PO, IV, IM, SC, PRN, BID, TID, QID."
+)
+
+# Words of four or more letters in any script; capitalized ones are candidate
+# drug names (checked per match, since re has no Unicode upper-case class)
+LETTER_WORD_RE = re.compile(r'\b[^\W\d_]{4,}\b')
+
+# Clinical abbreviation expansions, loaded once at import
+with open(os.path.join(os.path.dirname(__file__), 'medical_abbreviations.json'), encoding='utf-8') as f:
+    MEDICAL_ABBREVIATIONS = {abbr.upper(): expansion for abbr, expansion in json.load(f).items()}
+
+# Known drug and condition names, plus common misspellings mapped to them,
+# so most terms are validated locally instead of by GPT-4
+with open(os.path.join(os.path.dirname(__file__), 'medical_lexicon.json'), encoding='utf-8') as f:
+    _lexicon = json.load(f)
+    MEDICAL_LEXICON = frozenset(term.lower() for term in _lexicon['terms'])
+    MEDICAL_CORRECTIONS = {term.lower(): canonical.lower() for term, canonical in _lexicon['corrections'].items()}
+    del _lexicon
+
+def expand_medical_abbreviation(term: str) -> str:
+    """Expand a clinical abbreviation, returning the term unchanged if unknown"""
+    return MEDICAL_ABBREVIATIONS.get(term.upper(), term)
+
 def normalize_language_code(lang_code):
     """
     Normalize language codes to a standard format
@@ -93,16 +345,16 @@ def normalize_language_code(lang_code):
         return None
     
     lang_code = lang_code.lower()
-    base_code = lang_code.split('-')[0]
-    
-    if base_code in LANGUAGE_CODES:
-        return base_code
-    
-    for code, variants in LANGUAGE_CODES.items():
-        if lang_code in [v.lower() for v in variants]:
-            return code
-    
-    return None
+    return LANGUAGE_LOOKUP.get(lang_code.split('-')[0]) or LANGUAGE_LOOKUP.get(lang_code)
+
+def audio_cache_key(audio_data, language: str) -> str:
+    """Hash the raw audio bytes (without copying in-memory files) plus the language"""
+    if hasattr(audio_data, 'getbuffer'):
+        with audio_data.getbuffer() as audio_bytes:
+            digest = hashlib.blake2b(audio_bytes, digest_size=16).hexdigest()
+    else:
+        digest = hashlib.blake2b(audio_data, digest_size=16).hexdigest()
+    return f"{digest}:{language}"
 
 async def transcribe_audio(audio_data, language="en"):
     """
@@ -114,45 +366,31 @@ async def transcribe_audio(audio_data, language="en"):
         if not norm_lang:
             raise ValueError(f"Unsupported language code: {language}")
 
-        # Enhanced medical context prompt
-        medical_prompt = """
-        This is a specialized medical conversation requiring high accuracy. Please focus on:
-        1. Medical Terminology:
-           - Precise medical terms and diagnoses
-           - Anatomical terminology
-           - Disease names and conditions
-           - Medical procedures and treatments
-        2. Measurements and Dosages:
-           - Drug dosages (mg, mcg, mL)
-           - Vital signs (BP, HR, RR, SpO2)
-           - Lab values and ranges
-           - Temperature (°C/°F)
-        3. Medical Abbreviations:
-           - Standard medical abbreviations (PRN, BID, TID, QID)
-           - Route abbreviations (PO, IV, IM, SC)
-           - Common medical shorthand
-        4. Multilingual Medical Context:
-           - Standard medical terminology across languages
-           - International drug names
-           - Regional medical practices
-        5. Critical Information:
-           - Allergies and contraindications
-           - Emergency terminology
-           - Patient safety information
-        """
-        
-        # Create audio file object for the API
-        response = await client.audio.transcriptions.create(
-            model="whisper-1",
-            file=audio_data,
-            language=norm_lang,
-            prompt=medical_prompt,
-            temperature=0.2  # Lower temperature for more accurate medical terms
-        )
+        # Re-uploaded audio reuses its cached raw transcript; validation always
+        # runs again so transient fallbacks are never replayed from the cache.
+        # Disk access goes through a worker thread: diskcache can block on its
+        # SQLite lock, which would stall every request sharing the event loop
+        audio_key = audio_cache_key(audio_data, norm_lang)
+        transcript = await asyncio.to_thread(whisper_cache.get, audio_key)
+        cached = isinstance(transcript, str)  # entries from older versions held full results
+        if not cached:
+            transcript = None
+            # Create audio file object for the API
+            response = await transcription_client.audio.transcriptions.create(
+                model="whisper-1",
+                file=audio_data,
+                language=norm_lang,
+                prompt=WHISPER_MEDICAL_PROMPT,
+                temperature=0.2,  # Lower temperature for more accurate medical terms
+                timeout=WHISPER_TIMEOUT
+            )
+            if hasattr(response, 'text'):
+                transcript = response.text
+                await asyncio.to_thread(whisper_cache.set, audio_key, transcript, expire=WHISPER_CACHE_EXPIRE)
         
-        if hasattr(response, 'text'):
+        if transcript is not None:
             # Validate medical terms and calculate confidence
-            validated = validate_medical_terms(response.text)
+            validated = await validate_medical_terms_cached(transcript, norm_lang)
             
             # Calculate confidence based on medical term validation
             base_confidence = 0.85  # Base confidence for successful transcription
@@ -161,14 +399,17 @@ async def transcribe_audio(audio_data, language="en"):
             # Adjust confidence based on medical term validation
             adjusted_confidence = base_confidence * medical_confidence
             
-            return {
-                'text': validated.get('corrected_text', response.text) if isinstance(validated, dict) else response.text,
+            result = {
+                'text': validated.get('corrected_text', transcript) if isinstance(validated, dict) else transcript,
                 'language': norm_lang,
                 'confidence': adjusted_confidence,
                 'detected_language': norm_lang,
                 'medical_validation': validated if isinstance(validated, dict) else None,
                 'medical_terms_found': validated.get('medical_terms_found', []) if isinstance(validated, dict) else []
             }
+            if cached:
+                result['cached'] = True
+            return result
         else:
             return {
                 'text': str(response),
@@ -189,48 +430,55 @@ async def transcribe_audio(audio_data, language="en"):
             'message': str(e)
         }
 
+@lru_cache(maxsize=4096)
 def extract_medical_terms(text):
     """
-    Extract potential medical terms from text using patterns
+    Extract potential medical terms from text using patterns; memoized since
+    the same phrases recur in medical dialog, so the result is a shared tuple
     """
     medical_terms = []
     
-    # Extract terms matching medical patterns
-    for pattern_name, pattern in MEDICAL_PATTERNS.items():
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        for match in matches:
-            medical_terms.append({
-                'term': match.group(),
-                'type': pattern_name,
-                'position': match.span()
-            })
+    # Extract terms matching medical patterns in a single pass
+    for match in MEDICAL_TERMS_RE.finditer(text):
+        medical_terms.append({
+            'term': match.group(),
+            'type': match.lastgroup,
+            'position': match.span()
+        })
+        if match.lastgroup == 'common_abbreviations':
+            medical_terms[-1]['expansion'] = expand_medical_abbreviation(match.group())
     
-    # Extract potential drug names and medical conditions
-    words = text.split()
-    for word in words:
-        # Look for capitalized words that might be drug names
-        if word[0].isupper() and len(word) > 3:
-            medical_terms.append({
-                'term': word,
-                'type': 'potential_drug_name',
-                'position': (text.index(word), text.index(word) + len(word))
-            })
+    # Extract potential drug names and medical conditions; spans come from
+    # the match itself, so repeated words get their own positions
+    for match in LETTER_WORD_RE.finditer(text):
+        if not match.group()[0].isupper():
+            continue
+        medical_terms.append({
+            'term': match.group(),
+            'type': 'potential_drug_name',
+            'position': match.span()
+        })
     
-    return medical_terms
+    return tuple(medical_terms)
 
 async def validate_medical_terms(text):
     """
     Validate and correct medical terminology using pattern matching and OpenAI with optimizations
     """
+    # Too short or without letters to hold a medical term; skip all other work
+    stripped = text.strip()
+    if len(stripped) < 4 or not any(c.isalpha() for c in stripped):
+        return {'text': text, 'confidence': 1.0, 'validated': True, 'trivial': True}
+
     try:
         # Check cache first
         cache_key = generate_cache_key(text)
         if cached_result := get_cached_response(cache_key):
-            logger.info(f"Cache hit for text validation: {cache_key[:50]}...")
+            logger.info(f"Cache hit for text validation: {text[:50]}...")
             return cached_result
 
-        # Circuit breaker check
-        if not api_circuit_breaker.can_execute():
+        # Circuit breaker check; the probe slot is claimed right before the GPT-4 call
+        if api_circuit_breaker.is_open():
             logger.warning("Circuit breaker is open, using fallback validation")
             return {'text': text, 'confidence': 0.8, 'validated': True, 'circuit_breaker': 'open'}
 
@@ -243,15 +491,25 @@ async def validate_medical_terms(text):
             cache_response(cache_key, result)
             return result
 
-        # Batch validate medical terms first
-        terms_to_validate = [term['term'] for term in medical_terms]
-        validated_terms = await batch_validate_medical_terms(terms_to_validate)
+        # Pattern matches (dosages, vitals, abbreviations) are structurally valid,
+        # so only free-form candidates such as drug names go to GPT-4
+        validated_terms = {
+            term['term']: PATTERN_VALIDATIONS[term['type']]
+            for term in medical_terms if term['type'] in PATTERN_VALIDATIONS
+        }
 
-        # Early return for high-confidence terms
+        # Batch validate the remaining terms, each distinct term once
+        terms_to_validate = list(dict.fromkeys(
+            term['term'] for term in medical_terms if term['term'] not in validated_terms
+        ))
+        model_validations = await batch_validate_medical_terms(terms_to_validate)
+        validated_terms.update(model_validations)
+
+        # Early return for high-confidence terms; pattern matches are always
+        # confident, so only the model's verdicts need checking
         high_confidence = all(
-            term['term'] in validated_terms and 
-            validated_terms[term['term']].get('confidence', 0) > 0.95 
-            for term in medical_terms
+            validation.get('confidence', 0) > 0.95
+            for validation in model_validations.values()
         )
         if high_confidence:
             result = {
@@ -267,10 +525,10 @@ async def validate_medical_terms(text):
         # Prepare the context for GPT with the identified terms and their validations
         context = f"""
         Please validate and correct the following text, paying special attention to medical terminology:
-        {json.dumps([term['term'] for term in medical_terms], indent=2)}
+        {orjson.dumps([term['term'] for term in medical_terms]).decode()}
         
         Pre-validated terms:
-        {json.dumps(validated_terms, indent=2)}
+        {orjson.dumps(validated_terms).decode()}
         
         Rules for Medical Term Processing:
         1. Correct any misspelled medical terms (e.g., "penicillin", "allergic")
@@ -296,19 +554,19 @@ async def validate_medical_terms(text):
         - confidence: confidence score for the corrections (0.0 to 1.0)
         """
         
+        # Claim the call (or the half-open probe); a refusal is not an upstream
+        # failure, so it takes the fallback without touching the breaker
+        if not api_circuit_breaker.can_execute():
+            logger.warning("Circuit breaker is open, using fallback validation")
+            return {'text': text, 'confidence': 0.8, 'validated': True, 'circuit_breaker': 'open'}
+
         try:
-            # Implement retry mechanism with circuit breaker
-            if not api_circuit_breaker.can_execute():
-                raise Exception("Circuit breaker is open")
 
             response = await retry_api_call(
-                client.chat.completions.create,
+                validation_client.chat.completions.create,
                 model="gpt-4",
                 messages=[
-                    {
-                        "role": "system", 
-                        "content": "You are a medical terminology expert. Validate and correct medical terms while preserving the original meaning. Return your response in a valid JSON format."
-                    },
+                    VALIDATION_SYSTEM_MESSAGE,
                     {"role": "user", "content": context}
                 ],
                 temperature=0.3,  # Increased for faster processing
@@ -317,7 +575,7 @@ async def validate_medical_terms(text):
 
             if response.choices[0].message.content:
                 try:
-                    result = json.loads(response.choices[0].message.content)
+                    result = orjson.loads(response.choices[0].message.content)
                     
                     # Record success for circuit breaker
                     api_circuit_breaker.record_success()
@@ -336,8 +594,10 @@ async def validate_medical_terms(text):
                     cache_response(cache_key, result)
                     return result
                     
-                except json.JSONDecodeError as jde:
+                except orjson.JSONDecodeError as jde:
                     logger.error(f"JSON decode error: {str(jde)}")
+                    # The API itself answered; report it so a half-open probe is released
+                    api_circuit_breaker.record_success()
                     # Fallback to basic validation
                     result = {
                         'corrected_text': response.choices[0].message.content,
@@ -382,153 +642,456 @@ async def validate_medical_terms(text):
                 'original_text': text,
                 'fallback': 'complete_failure'
             }
+    except Exception as e:
+        logger.error(f"Medical term validation error: {str(e)}", exc_info=True)
+        return {
+            'error': 'validation_failed',
+            'message': str(e),
+            'original_text': text,
+            'fallback': 'complete_failure'
+        }
+
+# Memoized validation for repeated utterances
+def normalize_text(text: str) -> str:
+    """Normalize text so equivalent utterances share a cache entry"""
+    return unicodedata.normalize("NFKC", text).strip()
+
+# Validation results memoized by (normalized text, source language); only
+# touched from the event loop, so it needs no lock
+validation_memo = LRUCache(maxsize=4096)
+validation_memo_stats = {'hits': 0, 'misses': 0}
+# Validations in progress, so concurrent callers for the same text (e.g. the
+# app and translate_text) share one run instead of each calling GPT-4
+validations_in_flight = {}
+
+def is_transient_validation(result) -> bool:
+    """Errors and breaker fallbacks are transient; results built on them must not be cached"""
+    return isinstance(result, dict) and ('error' in result or 'fallback' in result or 'circuit_breaker' in result)
 
-async def translate_text(text, source_lang, target_lang):
+async def validate_medical_terms_cached(text: str, source_lang: Optional[str] = None) -> dict:
     """
-    Translate text using Google Translate API with optimizations and error handling
+    Memoized entry point for validate_medical_terms keyed on normalized text
     """
-    try:
-        # Normalize language codes
-        norm_source = normalize_language_code(source_lang)
-        norm_target = normalize_language_code(target_lang)
-# Cache key generator
-def generate_cache_key(text: str, source_lang: str = None, target_lang: str = None) -> str:
+    key = (normalize_text(text), normalize_language_code(source_lang))
+    if (cached := validation_memo.get(key)) is not None:
+        validation_memo_stats['hits'] += 1
+        return dict(cached)
+    validation_memo_stats['misses'] += 1
+
+    text_norm = key[0]
+    # The pattern scan is plain CPU work; skip validation entirely when it finds nothing
+    if not extract_medical_terms(text_norm):
+        result = {'text': text_norm, 'confidence': 1.0, 'validated': True}
+    else:
+        if (task := validations_in_flight.get(key)) is None:
+            task = asyncio.ensure_future(validate_medical_terms(text_norm))
+            validations_in_flight[key] = task
+            task.add_done_callback(lambda _: validations_in_flight.pop(key, None))
+        result = await asyncio.shield(task)
+        # Let the next call retry rather than replaying a transient result
+        if is_transient_validation(result):
+            return dict(result)
+    validation_memo[key] = result
+    return dict(result)
+
+def validation_cache_info():
+    return {**validation_memo_stats, 'maxsize': validation_memo.maxsize, 'currsize': validation_memo.currsize}
+
+# Cache key generator; tuple keys hash their parts directly instead of
+# copying the text into a concatenated string
+def text_digest(text: str) -> str:
+    """Fixed-size BLAKE2b digest so long transcripts are not kept as cache keys"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+def generate_cache_key(text: str, source_lang: str = None, target_lang: str = None) -> CacheKey:
     if source_lang and target_lang:
-        return f"{source_lang}:{target_lang}:{text}"
-    return f"validation:{text}"
+        return (source_lang, target_lang, text_digest(text))
+    return ('validation', text_digest(text))
+
+def translation_cache_key(text: str, source_lang: str, target_lang: str) -> CacheKey:
+    return ('translation', source_lang, target_lang, text_digest(normalize_text(text)))
 
 # Cache manager
-def cache_response(key: str, response: dict):
-    response_cache[key] = {
-        'data': response,
-        'timestamp': datetime.now()
-    }
+def cache_shard(key: CacheKey):
+    return response_cache[hash(key) & (CACHE_SHARDS - 1)]
 
-def get_cached_response(key: str) -> Optional[dict]:
-    if key in response_cache:
-        cache_entry = response_cache[key]
-        if datetime.now() - cache_entry['timestamp'] < timedelta(seconds=CACHE_TIMEOUT):
-            return cache_entry['data']
-        del response_cache[key]
-    return None
+def cache_response(key: CacheKey, response: dict):
+    entries, lock = cache_shard(key)
+    with lock:
+        entries[key] = {'data': response, 'timestamp': time.monotonic(), 'refreshing': False}
+
+# Background refreshes, referenced until done so they aren't garbage collected
+_refresh_tasks = set()
+
+async def _refresh_entry(key: CacheKey, entry: dict, refresh):
+    try:
+        await refresh()
+    except Exception as e:
+        logger.error(f"Background cache refresh failed: {str(e)}")
+    finally:
+        # A refresh that didn't write back lets the next stale read try again
+        entries, lock = cache_shard(key)
+        with lock:
+            if entries.get(key) is entry:
+                entry['refreshing'] = False
+
+def get_cached_response(key: CacheKey, refresh=None) -> Optional[dict]:
+    """
+    Fresh entries are returned as is. Stale ones, within their kind's stale
+    window, are returned too, and `refresh` (a coroutine function that
+    recomputes and re-caches the value) is scheduled once in the background.
+    """
+    entries, lock = cache_shard(key)
+    with lock:
+        entry = entries.get(key)
+        if entry is None:
+            return None
+        age = time.monotonic() - entry['timestamp']
+        if age < CACHE_TIMEOUT:
+            return entry['data']
+        if age >= CACHE_TIMEOUT + STALE_WINDOWS.get(key[0], 0):
+            del entries[key]
+            return None
+        start_refresh = refresh is not None and not entry['refreshing']
+        if start_refresh:
+            entry['refreshing'] = True
+
+    if start_refresh:
+        task = asyncio.get_running_loop().create_task(_refresh_entry(key, entry, refresh))
+        _refresh_tasks.add(task)
+        task.add_done_callback(_refresh_tasks.discard)
+    return entry['data']
+
+def flush_translation_cache() -> int:
+    """Drop every cached translation and return how many entries were removed"""
+    flushed = 0
+    for entries, lock in response_cache:
+        with lock:
+            keys = [key for key in entries if key[0] == 'translation']
+            for key in keys:
+                del entries[key]
+        flushed += len(keys)
+    return flushed
 
 # Batch processing for medical terms
-@lru_cache(maxsize=1000)
-def validate_medical_term_cached(term: str) -> dict:
-    """Cache individual medical term validations"""
+def lookup_medical_term(term: str) -> Optional[dict]:
+    """Validate a term against the local lexicon; None if it is unknown"""
+    key = term.strip().lower()
+    canonical = MEDICAL_CORRECTIONS.get(key, key)
+    if canonical not in MEDICAL_LEXICON:
+        return None
+    corrected = canonical != key
+    # A known misspelling must not pass as high confidence, or the GPT-4 pass
+    # that rewrites the text would be skipped and the typo sent on uncorrected
+    return {'confidence': 0.9 if corrected else 1.0, 'canonical': canonical, 'corrected': corrected, 'source': 'lexicon'}
+
+async def get_cached_term(term: str, refresh=None) -> Optional[dict]:
+    """Term validation from memory, falling back to the persistent term cache off the loop"""
+    if cached_result := get_cached_response(('term', term), refresh=refresh):
+        return cached_result
+    # Non-dict entries may have been written before replies were checked
+    if isinstance(cached_result := await asyncio.to_thread(term_cache.get, term), dict):
+        cache_response(('term', term), cached_result)
+        return cached_result
+    return None
+
+async def cache_term(term: str, result: dict):
+    cache_response(('term', term), result)
+    await asyncio.to_thread(term_cache.set, term, result, expire=TERM_CACHE_EXPIRE)
+
+async def validate_medical_term_cached(term: str, use_cache: bool = True) -> dict:
+    """Cache individual medical term validations in the response cache"""
+    if local_result := lookup_medical_term(term):
+        return local_result
+    if use_cache and (cached_result := await get_cached_term(
+            term, refresh=lambda: validate_medical_term_cached(term, use_cache=False))):
+        return cached_result
     try:
-        response = client.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": "Validate this medical term and return JSON"},
-                {"role": "user", "content": term}
-            ],
-            temperature=0.3,
-            max_tokens=100
-        )
-        return json.loads(response.choices[0].message.content)
+        async with openai_semaphore:
+            response = await validation_client.chat.completions.create(
+                model="gpt-4",
+                messages=[
+                    TERM_VALIDATION_SYSTEM_MESSAGE,
+                    {"role": "user", "content": term}
+                ],
+                temperature=0.3,
+                max_tokens=100
+            )
+        result = orjson.loads(response.choices[0].message.content)
+        if not isinstance(result, dict):
+            return {"error": "validation response is not a JSON object"}
+        await cache_term(term, result)
+        return result
     except Exception as e:
         logger.error(f"Error validating medical term {term}: {str(e)}")
+        if isinstance(e, APITimeoutError):
+            api_circuit_breaker.record_failure()
         return {"error": str(e)}
 
+async def validate_unknown_medical_terms(terms: Tuple[str, ...]) -> Dict[str, Any]:
+    """Validate terms missing from the lexicon with a single GPT-4 request"""
+    try:
+        async with openai_semaphore:
+            response = await validation_client.chat.completions.create(
+                model="gpt-4",
+                messages=[
+                    TERM_VALIDATION_SYSTEM_MESSAGE,
+                    {"role": "user", "content": orjson.dumps({"terms": list(terms)}).decode() +
+                        "\nReturn a JSON object with one validation object per term, keyed by the term."}
+                ],
+                temperature=0.3,
+                max_tokens=100 * len(terms)
+            )
+        validations = orjson.loads(response.choices[0].message.content)
+    except Exception as e:
+        logger.error(f"Error validating medical terms {terms}: {str(e)}")
+        if isinstance(e, APITimeoutError):
+            api_circuit_breaker.record_failure()
+        return {term: {"error": str(e)} for term in terms}
+
+    results = {}
+    for term in terms:
+        result = validations.get(term) if isinstance(validations, dict) else None
+        if isinstance(result, dict):
+            await cache_term(term, result)
+        else:
+            result = {"error": "term missing from validation response"}
+        results[term] = result
+    return results
+
 async def batch_validate_medical_terms(terms: List[str]) -> Dict[str, Any]:
-    """Process multiple medical terms in parallel"""
-    tasks = []
-    with ThreadPoolExecutor() as executor:
-        for term in terms:
-            if cached_result := get_cached_response(f"term:{term}"):
-                tasks.append(asyncio.create_task(asyncio.to_thread(lambda: cached_result)))
-            else:
-                tasks.append(asyncio.create_task(asyncio.to_thread(validate_medical_term_cached, term)))
-    
-    results = await asyncio.gather(*tasks)
-    return {term: result for term, result in zip(terms, results)}
+    """
+    Resolve terms from the local lexicon and the term cache; whatever is left
+    goes to GPT-4, in one request however many terms remain
+    """
+    results = {}
+    unknown = []
+    for term in terms:
+        if result := lookup_medical_term(term) or await get_cached_term(
+                term, refresh=lambda term=term: validate_medical_term_cached(term, use_cache=False)):
+            results[term] = result
+        else:
+            unknown.append(term)
+
+    if len(unknown) == 1:
+        results[unknown[0]] = await validate_medical_term_cached(unknown[0])
+    elif unknown:
+        results.update(await validate_unknown_medical_terms(tuple(unknown)))
+    return results
+
+# Only transient OpenAI failures are retried; auth and bad-request errors fail at once
+RETRYABLE_API_ERRORS = (RateLimitError, APIConnectionError, APITimeoutError, InternalServerError)
+RETRY_MAX_WAIT = 30  # seconds
+_jittered_backoff = wait_random_exponential(multiplier=1, max=RETRY_MAX_WAIT)
+
+def wait_for_retry(retry_state):
+    """Honor the server's Retry-After header, else back off exponentially with full jitter"""
+    response = getattr(retry_state.outcome.exception(), 'response', None)
+    retry_after = response.headers.get('retry-after') if response is not None else None
+    try:
+        return min(float(retry_after), RETRY_MAX_WAIT)
+    except (TypeError, ValueError):
+        return _jittered_backoff(retry_state)
+
+def record_retried_failure(retry_state):
+    """Count each failed attempt against the circuit breaker, not just the last one"""
+    logger.error(f"API call failed, retrying: {str(retry_state.outcome.exception())}")
+    api_circuit_breaker.record_failure()
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
+@retry(
+    retry=retry_if_exception_type(RETRYABLE_API_ERRORS),
+    wait=wait_for_retry,
+    stop=stop_after_attempt(3),
+    before_sleep=record_retried_failure,
+    reraise=True
+)
 async def retry_api_call(func, *args, **kwargs):
-    """Generic retry mechanism for API calls"""
+    """Generic retry mechanism for API calls; func must be a coroutine function"""
     try:
-        return await func(*args, **kwargs)
+        async with openai_semaphore:
+            return await func(*args, **kwargs)
     except Exception as e:
         logger.error(f"API call failed: {str(e)}")
         raise
 
-# Early return for high-confidence terms
-def is_high_confidence_term(term: str, threshold: float = 0.95) -> bool:
-    """Check if a term can skip full validation"""
-    cache_key = f"confidence:{term}"
-    if cached_conf := get_cached_response(cache_key):
-        return cached_conf.get('confidence', 0) > threshold
-    return False
-
 # Request pooling for translations
 class TranslationPool:
+    """
+    Producer/consumer batching: callers queue a request and await its future,
+    and one background runner flushes a batch once it is full or `timeout`
+    after its first request
+    """
     def __init__(self, max_size=10, timeout=1.0):
-        self.pool = deque(maxlen=max_size)
+        self.max_size = max_size
         self.timeout = timeout
-        self._last_flush = time.time()
+        self._queue = asyncio.Queue()
+        self._runner_task = None
+        self._flush_tasks = set()
 
-    async def add_request(self, text: str, source_lang: str, target_lang: str) -> Dict:
-        self.pool.append((text, source_lang, target_lang))
-        
-        if len(self.pool) >= self.pool.maxlen or time.time() - self._last_flush > self.timeout:
-            return await self.flush()
-        return None
+    async def add_request(self, text: str, source_lang: str, target_lang: str):
+        """Queue a translation and wait for the batch it lands in to be flushed"""
+        if self._runner_task is None:
+            self._runner_task = asyncio.create_task(self._runner())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, source_lang, target_lang, future))
+        return await future
 
-    async def flush(self) -> Dict:
-        if not self.pool:
-            return {}
+    async def _runner(self):
+        """Single long-lived task collecting batches; flushes run alongside the next batch"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.timeout
+            try:
+                async with asyncio.timeout_at(deadline):
+                    while len(batch) < self.max_size:
+                        batch.append(await self._queue.get())
+            except TimeoutError:
+                pass
+            task = asyncio.create_task(self.flush(batch))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
 
-        texts, sources, targets = zip(*self.pool)
-        self.pool.clear()
-        self._last_flush = time.time()
+    async def flush(self, batch):
+        # Identical requests in a batch share one translation, and anything
+        # translate_text already cached is not sent again
+        translations = {}
+        pending = []
+        for text, source_lang, target_lang, _ in batch:
+            request = (text, source_lang, target_lang)
+            if request in translations:
+                continue
+            cached = get_cached_response(translation_cache_key(
+                text, normalize_language_code(source_lang), normalize_language_code(target_lang)))
+            if cached:
+                translations[request] = {'text': cached['text'], 'src': cached['source_lang'], 'dest': cached['target_lang']}
+            else:
+                translations[request] = None
+                pending.append(request)
 
-        try:
-            translator = Translator()
-            translations = translator.translate(list(texts), src=sources[0], dest=targets[0])
-            return {text: trans for text, trans in zip(texts, translations)}
-        except Exception as e:
-            logger.error(f"Batch translation failed: {str(e)}")
-            return {}
+        results = await asyncio.gather(*(google_translate(*request) for request in pending), return_exceptions=True)
+        translations.update(zip(pending, results))
+
+        for text, source_lang, target_lang, future in batch:
+            if future.done():
+                continue
+            translation = translations[(text, source_lang, target_lang)]
+            if isinstance(translation, Exception):
+                logger.error(f"Batch translation failed: {str(translation)}")
+                future.set_exception(translation)
+            else:
+                future.set_result(translation)
 
 # Initialize translation pool
 translation_pool = TranslationPool()
+
+# Terms frozen through translation. Stricter than MEDICAL_TERMS_RE, which only
+# flags candidates for validation: units must end at a word boundary ("2 g" is
+# not the start of "2 grandkids") and abbreviations are matched case-sensitively
+# so words such as Italian "po" or English "im" are still translated
+PROTECTED_TERMS_RE = re.compile(
+    r'\d+\s*(?:mg|mcg|ml|mL|g|kg|mmHg)\b|\d+\s*°[CF]\b'
+    r'|\b(?:BP|HR|RR|SpO2|Temp)[:\s]*\d+'
+    r'|\b(?:IV|IM|SC|PO|PRN|BID|TID|QID|QD|HS)\b'
+)
+
+# Placeholders used to carry medical terms through translation; tolerant of
+# spaces the translator may insert inside them
+PLACEHOLDER_RE = re.compile(r'__\s*MT\s*(\d+)\s*__')
+
+def protect_medical_terms(text: str):
+    """
+    Replace pattern-matched medical terms with placeholders, building the new
+    text in one pass over the match spans
+    """
+    parts = []
+    preserved_terms = []
+    last_end = 0
+    for match in PROTECTED_TERMS_RE.finditer(text):
+        parts.append(text[last_end:match.start()])
+        parts.append(f"__MT{len(preserved_terms)}__")
+        preserved_terms.append(match.group())
+        last_end = match.end()
+    if not preserved_terms:
+        return text, preserved_terms
+    parts.append(text[last_end:])
+    return "".join(parts), preserved_terms
+
+def restore_medical_terms(text: str, preserved_terms: List[str]) -> str:
+    """Put preserved terms back in a single scan with the precompiled placeholder regex"""
+    if not preserved_terms:
+        return text
+
+    def restore(match):
+        index = int(match.group(1))
+        return preserved_terms[index] if index < len(preserved_terms) else match.group()
+
+    return PLACEHOLDER_RE.sub(restore, text)
+
+async def translate_text(text, source_lang, target_lang, use_cache=True):
+    """
+    Translate text using Google Translate API with optimizations and error handling
+    """
+    try:
+        # Normalize language codes
+        norm_source = normalize_language_code(source_lang)
+        norm_target = normalize_language_code(target_lang)
         
         if not norm_source:
             raise ValueError(f"Unsupported source language: {source_lang}")
         if not norm_target:
             raise ValueError(f"Unsupported target language: {target_lang}")
         
+        # Nothing to translate; skip the cache, validation and the translator
+        if not text or not text.strip():
+            return {
+                'text': text,
+                'source_lang': norm_source,
+                'target_lang': norm_target,
+                'confidence': None,
+                'medical_validation': None
+            }
+        
+        # Repeated (text, source, target) triples are served from the cache
+        cache_key = translation_cache_key(text, norm_source, norm_target)
+        if use_cache and (cached_result := get_cached_response(
+                cache_key, refresh=lambda: translate_text(text, source_lang, target_lang, use_cache=False))):
+            return {**cached_result, 'cache_hit': True}
+        
         # Special handling for Chinese variants
-        if target_lang.startswith('zh'):
-            target_lang = 'zh-CN'  # Default to Simplified Chinese
+        dest_lang = 'zh-CN' if norm_target == 'zh' else norm_target  # Default to Simplified Chinese
         
-        # Validate medical terms before translation
-        validated = validate_medical_terms(text)
+        # Validate medical terms before translation; too short to hold one otherwise
+        validated = await validate_medical_terms_cached(text, norm_source) if len(text.strip()) >= 3 else None
         text_to_translate = validated.get('corrected_text', text) if isinstance(validated, dict) and 'corrected_text' in validated else text
         
-        translator = Translator()
-        translation = translator.translate(
-            text_to_translate,
-            src=source_lang,
-            dest=target_lang
-        )
+        # Keep dosages, vital signs and abbreviations out of the translator;
+        # one search gates the placeholder pass for text without any
+        preserved_terms = []
+        if PROTECTED_TERMS_RE.search(text_to_translate):
+            text_to_translate, preserved_terms = protect_medical_terms(text_to_translate)
+        
+        translation = await google_translate(text_to_translate, norm_source, dest_lang)
         
         result = {
-            'text': translation.text if hasattr(translation, 'text') else str(translation),
-            'source_lang': translation.src if hasattr(translation, 'src') else source_lang,
-            'target_lang': translation.dest if hasattr(translation, 'dest') else target_lang,
-            'confidence': translation.confidence if hasattr(translation, 'confidence') else None,
+            'text': restore_medical_terms(translation['text'], preserved_terms),
+            'source_lang': translation['src'],
+            'target_lang': translation['dest'],
+            'confidence': None,
             'medical_validation': validated if isinstance(validated, dict) else None
         }
         
         # Validate translated medical terms
+        translated_validation = None
         if norm_target != 'en':  # If not translating to English, validate the translated text
-            translated_validation = validate_medical_terms(result['text'])
+            translated_validation = await validate_medical_terms_cached(result['text'], norm_target)
             if isinstance(translated_validation, dict) and 'corrected_text' in translated_validation:
                 result['text'] = translated_validation['corrected_text']
                 result['translated_validation'] = translated_validation
         
+        # A translation resting on a fallback validation is served once, not pinned
+        if not (is_transient_validation(validated) or is_transient_validation(translated_validation)):
+            cache_response(cache_key, result)
         return result
         
     except ValueError as e: